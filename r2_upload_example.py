@@ -16,30 +16,57 @@ Usage:
 
     # Upload all files in a directory
     python r2_upload_example.py --dir /path/to/downloads/
+
+    # Upload a directory, packing small segments of each anchor into tar archives
+    python r2_upload_example.py --dir --pack /path/to/downloads/
 """
 
 import sys
 import os
 import asyncio
 import argparse
-from pathlib import Path
+import functools
 
 # Add src to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from src.r2_uploader import R2Uploader, create_r2_uploader_from_config, upload_video_to_r2
+from src.r2_uploader import (
+    R2Uploader, create_r2_uploader_from_config, upload_video_to_r2, build_object_name,
+    MAX_CONCURRENCY, SMALL_FILE_THRESHOLD, PACK_MAX_FILES
+)
 from loguru import logger
 
+# Number of files uploaded at the same time when uploading a directory
+UPLOAD_WORKERS = 8
+# Every file upload may use up to MAX_CONCURRENCY connections for its parts
+POOL_CONNECTIONS = UPLOAD_WORKERS * MAX_CONCURRENCY + 4
+
+# File extensions uploaded by --dir when no format filter is given
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mkv', '.flv', '.ts', '.m3u8', '.avi', '.mov', '.wmv'})
+
+# Path component that recordings are stored under
+DOWNLOADS_MARKER = os.sep + 'downloads' + os.sep
+
+# Parsed R2 settings keyed by config path, invalidated when the file's mtime changes
+_CONFIG_CACHE = {}
+
 
 def read_config():
     """Read configuration from config.ini file."""
     import configparser
+    from pathlib import Path
 
     config_path = Path(__file__).parent / 'config' / 'config.ini'
-    if not config_path.exists():
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except FileNotFoundError:
         logger.error(f"Config file not found: {config_path}")
         return None
 
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached and cached[0] == mtime_ns:
+        return dict(cached[1])
+
     config = configparser.ConfigParser()
     config.read(config_path, encoding='utf-8-sig')
 
@@ -58,16 +85,13 @@ def read_config():
         r2_config['delete_after_upload'] = section.get('上传后删除本地文件', '否')
         r2_config['upload_format_filter'] = section.get('上传文件格式过滤', '')
 
-    return r2_config
+    _CONFIG_CACHE[config_path] = (mtime_ns, r2_config)
+    return dict(r2_config)
 
 
 async def upload_single_file(uploader, file_path, platform='unknown', anchor='unknown', delete_after=False):
     """Upload a single file to R2."""
-    if not os.path.exists(file_path):
-        logger.error(f"File not found: {file_path}")
-        return False
-
-    logger.info(f"Uploading {file_path}...")
+    logger.info("Uploading {}...", file_path)
 
     result = await upload_video_to_r2(
         uploader=uploader,
@@ -78,60 +102,185 @@ async def upload_single_file(uploader, file_path, platform='unknown', anchor='un
     )
 
     if result.get('success'):
-        logger.success(f"Upload successful!")
-        logger.info(f"  Object: {result.get('object_name')}")
-        logger.info(f"  Size: {result.get('size', 0) / 1024 / 1024:.2f} MB")
+        logger.success("Upload successful!")
+        logger.info("  Object: {}", result.get('object_name'))
+        logger.info("  Size: {:.2f} MB", result.get('size', 0) / 1048576)
         if 'url' in result:
-            logger.info(f"  URL: {result.get('url')}")
+            logger.info("  URL: {}", result.get('url'))
         return True
     else:
         logger.error(f"Upload failed: {result.get('error')}")
         return False
 
 
-async def upload_directory(uploader, dir_path, delete_after=False, format_filter=None):
-    """Upload all video files in a directory to R2."""
+@functools.lru_cache(maxsize=32)
+def parse_format_filter(format_filter):
+    """Turn a comma-separated format filter such as 'mp4, MKV' into a set of extensions."""
+    return frozenset(f".{fmt.strip().lower()}" for fmt in format_filter.split(',') if fmt.strip())
+
+
+def iter_video_files(dir_path, extensions):
+    """
+    Recursively yield paths of files under dir_path whose extension is in extensions.
+
+    Folders that cannot be read are skipped with a warning, like os.walk does.
+    """
+    try:
+        it = os.scandir(dir_path)
+    except OSError as e:
+        logger.warning(f"Skipping unreadable folder {dir_path}: {e}")
+        return
+
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_video_files(entry.path, extensions)
+            else:
+                name = entry.name
+                dot = name.rfind('.')
+                if dot >= 0 and name[dot:].lower() in extensions:
+                    yield entry.path
+
+
+async def upload_pack(uploader, files, platform='unknown', anchor='unknown', delete_after=False, base_dir=None):
+    """
+    Upload several small files from one folder as a tar pack to R2.
+
+    The pack is stored next to where the first file would have been uploaded,
+    and members keep their path relative to base_dir.
+    Returns (success_count, fail_count).
+    """
+    pack_key = build_object_name(os.path.splitext(files[0])[0] + '.pack.tar')
+
+    result = await uploader.upload_batch_async(
+        files,
+        pack_key,
+        metadata={'platform': platform, 'anchor': anchor, 'files': str(len(files))},
+        base_dir=base_dir
+    )
+
+    if not result.get('success'):
+        logger.error(f"Pack upload failed for {pack_key}: {result.get('error')}")
+        return 0, len(files)
+
+    packed = result.get('files', [])
+    logger.success("Uploaded {} files as {}", len(packed), pack_key)
+    if delete_after:
+        for file_path in packed:
+            try:
+                os.remove(file_path)
+            except OSError as e:
+                logger.warning(f"Failed to delete local file {file_path}: {e}")
+    return len(packed), len(result.get('missing', []))
+
+
+def parse_platform_anchor(file_path):
+    """
+    Extract platform and anchor from a recording path.
+
+    Expected structure: downloads/platform/anchor/video.mp4
+    Returns ('unknown', 'unknown') when the path does not match.
+    """
+    if os.altsep:
+        file_path = file_path.replace(os.altsep, os.sep)
+
+    if file_path.startswith(DOWNLOADS_MARKER[1:]):
+        start = len(DOWNLOADS_MARKER) - 1
+    else:
+        start = file_path.find(DOWNLOADS_MARKER)
+        if start < 0:
+            return 'unknown', 'unknown'
+        start += len(DOWNLOADS_MARKER)
+
+    # Needs at least platform/name below downloads, like the original Path.parts check
+    tail = file_path[start:].split(os.sep, 2)
+    if len(tail) < 2:
+        return 'unknown', 'unknown'
+    return tail[0], tail[1]
+
+
+async def upload_directory(uploader, dir_path, delete_after=False, format_filter=None, pack_small_files=False):
+    """
+    Upload all video files in a directory to R2.
+
+    With pack_small_files, files smaller than SMALL_FILE_THRESHOLD in the same
+    folder are uploaded together as tar packs of up to PACK_MAX_FILES files.
+    """
     if not os.path.isdir(dir_path):
         logger.error(f"Directory not found: {dir_path}")
         return
 
-    # Define video extensions
-    video_extensions = {'.mp4', '.mkv', '.flv', '.ts', '.m3u8', '.avi', '.mov', '.wmv'}
-
     # Apply format filter if specified
-    if format_filter:
-        formats = [f".{fmt.strip().lower()}" for fmt in format_filter.split(',')]
-        video_extensions = set(formats)
+    video_extensions = parse_format_filter(format_filter) if format_filter else VIDEO_EXTENSIONS
 
     # Find all video files
-    video_files = []
-    for root, dirs, files in os.walk(dir_path):
-        for file in files:
-            if Path(file).suffix.lower() in video_extensions:
-                video_files.append(os.path.join(root, file))
+    video_files = list(iter_video_files(dir_path, video_extensions))
 
     logger.info(f"Found {len(video_files)} video files to upload")
 
-    # Upload files
+    # Group small files per folder so they can be packed together
+    single_files = video_files
+    packs = []
+    if pack_small_files:
+        single_files = []
+        groups = {}
+        for file_path in video_files:
+            try:
+                file_size = os.stat(file_path).st_size
+            except OSError as e:
+                # The file may have been removed or rotated since the scan
+                logger.warning(f"Skipping {file_path}: {e}")
+                continue
+            if file_size < SMALL_FILE_THRESHOLD:
+                groups.setdefault(os.path.dirname(file_path), []).append(file_path)
+            else:
+                single_files.append(file_path)
+
+        for files in groups.values():
+            if len(files) < 2:
+                single_files.extend(files)
+                continue
+            platform, anchor = parse_platform_anchor(files[0])
+            files.sort()
+            for start in range(0, len(files), PACK_MAX_FILES):
+                packs.append((platform, anchor, files[start:start + PACK_MAX_FILES]))
+
+        if packs:
+            logger.info(f"Packing {sum(len(pack[2]) for pack in packs)} small files into {len(packs)} packs")
+
+    # Upload files concurrently, bounded by UPLOAD_WORKERS
+    sem = asyncio.Semaphore(UPLOAD_WORKERS)
+
+    async def _run(file_path):
+        platform, anchor = parse_platform_anchor(file_path)
+
+        async with sem:
+            return await upload_single_file(uploader, file_path, platform, anchor, delete_after)
+
+    async def _run_pack(platform, anchor, files):
+        async with sem:
+            return await upload_pack(uploader, files, platform, anchor, delete_after, base_dir=dir_path)
+
+    results, pack_results = await asyncio.gather(
+        asyncio.gather(*[_run(f) for f in single_files], return_exceptions=True),
+        asyncio.gather(*[_run_pack(*pack) for pack in packs], return_exceptions=True)
+    )
+
     success_count = 0
     fail_count = 0
+    for (_, _, files), result in zip(packs, pack_results):
+        if isinstance(result, Exception):
+            logger.error(f"Pack upload error for {files[0]}: {result}")
+            fail_count += len(files)
+        else:
+            success_count += result[0]
+            fail_count += result[1]
 
-    for file_path in video_files:
-        # Try to extract platform and anchor from path
-        # Expected structure: downloads/platform/anchor/video.mp4
-        parts = Path(file_path).parts
-        platform = 'unknown'
-        anchor = 'unknown'
-
-        if len(parts) >= 3:
-            if 'downloads' in parts:
-                idx = parts.index('downloads')
-                if idx + 2 < len(parts):
-                    platform = parts[idx + 1]
-                    anchor = parts[idx + 2]
-
-        success = await upload_single_file(uploader, file_path, platform, anchor, delete_after)
-        if success:
+    for file_path, result in zip(single_files, results):
+        if isinstance(result, Exception):
+            logger.error(f"Upload error for {file_path}: {result}")
+            fail_count += 1
+        elif result:
             success_count += 1
         else:
             fail_count += 1
@@ -146,6 +295,7 @@ async def main():
     parser.add_argument('--config', action='store_true', help='Use configuration from config.ini')
     parser.add_argument('--dir', action='store_true', help='Upload all videos in directory')
     parser.add_argument('--delete', action='store_true', help='Delete local files after upload')
+    parser.add_argument('--pack', action='store_true', help='Pack small files of the same anchor into tar archives (with --dir)')
     parser.add_argument('--platform', default='unknown', help='Platform name')
     parser.add_argument('--anchor', default='unknown', help='Anchor/streamer name')
 
@@ -171,7 +321,7 @@ async def main():
         logger.info("Loading configuration from config.ini...")
         config = read_config()
         if config:
-            uploader = create_r2_uploader_from_config(config)
+            uploader = create_r2_uploader_from_config(config, max_pool_connections=POOL_CONNECTIONS)
             delete_after = config.get('delete_after_upload', '否') in ['是', 'yes', 'true', '1']
             if args.delete:
                 delete_after = True
@@ -190,7 +340,8 @@ async def main():
             access_key_id=args.access_key,
             secret_access_key=args.secret_key,
             bucket_name=args.bucket,
-            public_url=args.public_url
+            public_url=args.public_url,
+            max_pool_connections=POOL_CONNECTIONS
         )
         delete_after = args.delete
 
@@ -199,12 +350,16 @@ async def main():
         sys.exit(1)
 
     # Upload
-    if args.dir:
-        # Upload directory
-        await upload_directory(uploader, args.path, delete_after)
-    else:
-        # Upload single file
-        await upload_single_file(uploader, args.path, args.platform, args.anchor, delete_after)
+    try:
+        if args.dir:
+            # Upload directory
+            await upload_directory(uploader, args.path, delete_after, pack_small_files=args.pack)
+        else:
+            # Upload single file
+            await upload_single_file(uploader, args.path, args.platform, args.anchor, delete_after)
+    finally:
+        await uploader.aclose()
+        uploader.close()
 
 
 if __name__ == '__main__':
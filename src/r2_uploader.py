@@ -8,18 +8,84 @@ Function: Upload recorded videos to Cloudflare R2 storage.
 
 import os
 import asyncio
-from pathlib import Path
-from typing import Optional, Dict, Any
+import random
+import functools
+import mimetypes
+import mmap
+import tarfile
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterator, List, Mapping
+import httpx
 from loguru import logger
 
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig, create_transfer_manager
+    from botocore.config import Config
     from botocore.exceptions import ClientError, BotoCoreError
     BOTO3_AVAILABLE = True
 except ImportError:
     BOTO3_AVAILABLE = False
     logger.warning("boto3 not installed. R2 upload functionality will be disabled. Install with: pip install boto3")
 
+try:
+    import aioboto3
+    from aiobotocore.config import AioConfig
+    AIOBOTO3_AVAILABLE = True
+except ImportError:
+    # Optional: without aioboto3 async uploads run the boto3 client in a thread pool
+    AIOBOTO3_AVAILABLE = False
+
+# Multipart upload tuning: files above the threshold are split into chunks
+# that are uploaded concurrently by boto3's transfer threads.
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+MAX_CONCURRENCY = 10
+# Threads running blocking boto3 calls for the async API
+UPLOAD_THREADS = 16
+# Block size used when streaming a part from the memory-mapped file
+STREAM_BLOCK_SIZE = 1024 * 1024
+# Lifetime of the presigned UploadPart URLs in seconds
+PRESIGNED_URL_EXPIRES = 3600
+# Attempts per part for presigned uploads, retried with exponential backoff (seconds)
+PART_MAX_ATTEMPTS = 5
+PART_RETRY_BACKOFF = 1.0
+# Small files (e.g. HLS segments) can be packed into one tar object per batch
+SMALL_FILE_THRESHOLD = 5 * 1024 * 1024
+PACK_MAX_FILES = 50
+# Packs larger than this are spooled to a temporary file instead of memory
+PACK_SPOOL_SIZE = 64 * 1024 * 1024
+
+# Number of file_exists results remembered per uploader and how long they stay valid (seconds)
+EXISTS_CACHE_SIZE = 1024
+EXISTS_CACHE_TTL = 60
+
+# Connection settings shared by every S3 client. Keep-alive lets consecutive uploads
+# reuse pooled TLS connections instead of doing a new handshake per request.
+DEFAULT_POOL_CONNECTIONS = 32
+_CLIENT_CONFIG_OPTIONS = {
+    'connect_timeout': 10,
+    'read_timeout': 120,
+    'tcp_keepalive': True,
+    'retries': {'total_max_attempts': 5, 'mode': 'adaptive'},
+    'user_agent_extra': 'douyin-live-recorder/r2',
+}
+_CLIENT_CONFIG = Config(**_CLIENT_CONFIG_OPTIONS) if BOTO3_AVAILABLE else None
+
+# S3 clients shared between uploaders, keyed by endpoint, credentials, bucket and pool size.
+# Building a client loads botocore's service models, so it is done once per distinct configuration.
+_CLIENT_CACHE: Dict[tuple, Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# Object names always use forward slashes regardless of the local path separator
+_PATH_SEPARATORS = '/\\'
+_BACKSLASH_TO_SLASH = str.maketrans('\\', '/')
+
 
 class R2Uploader:
     """
@@ -29,6 +95,20 @@ class R2Uploader:
     cost-effective storage with zero egress fees.
     """
 
+    # Recording formats take precedence over the platform's mimetypes database
+    _CONTENT_TYPES: Mapping[str, str] = MappingProxyType({
+        '.mp4': 'video/mp4',
+        '.mkv': 'video/x-matroska',
+        '.flv': 'video/x-flv',
+        '.ts': 'video/mp2t',
+        '.m3u8': 'application/vnd.apple.mpegurl',
+        '.mp3': 'audio/mpeg',
+        '.m4a': 'audio/mp4',
+        '.aac': 'audio/aac',
+        '.txt': 'text/plain',
+        '.json': 'application/json',
+    })
+
     def __init__(
         self,
         account_id: str,
@@ -36,7 +116,9 @@ class R2Uploader:
         secret_access_key: str,
         bucket_name: str,
         endpoint_url: Optional[str] = None,
-        public_url: Optional[str] = None
+        public_url: Optional[str] = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        max_pool_connections: Optional[int] = None
     ):
         """
         Initialize R2 uploader.
@@ -48,6 +130,10 @@ class R2Uploader:
             bucket_name: R2 bucket name
             endpoint_url: Custom endpoint URL (auto-generated if not provided)
             public_url: Public URL for accessing uploaded files (optional)
+            max_concurrency: Number of parts uploaded in parallel for multipart uploads
+            max_pool_connections: HTTP connection pool size (defaults to DEFAULT_POOL_CONNECTIONS,
+                or max_concurrency + 4 if that is larger),
+                raise it when several files are uploaded concurrently
         """
         if not BOTO3_AVAILABLE:
             raise ImportError("boto3 is required for R2 upload. Install with: pip install boto3")
@@ -61,21 +147,89 @@ class R2Uploader:
             endpoint_url = f"https://{account_id}.r2.cloudflarestorage.com"
 
         self.endpoint_url = endpoint_url
+        self._access_key_id = access_key_id
+        self._secret_access_key = secret_access_key
+
+        # Large recordings are split into parts and uploaded in parallel
+        self._transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=MULTIPART_CHUNKSIZE,
+            max_concurrency=max_concurrency,
+            use_threads=True,
+            max_io_queue=100
+        )
+        # aioboto3 fills its read queue with whole parts, so keep it to one part per
+        # upload slot instead of buffering up to max_io_queue parts in memory
+        self._async_transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=MULTIPART_CHUNKSIZE,
+            max_concurrency=max_concurrency,
+            max_io_queue=max_concurrency
+        )
 
-        # Initialize S3 client for R2
+        if max_pool_connections is None:
+            # Leave headroom above the transfer threads so parts never wait for a connection
+            max_pool_connections = max(DEFAULT_POOL_CONNECTIONS, max_concurrency + 4)
+        self._max_pool_connections = max_pool_connections
+
+        # Dedicated pool for blocking boto3 calls so uploads do not starve the default executor
+        self._executor = ThreadPoolExecutor(max_workers=UPLOAD_THREADS, thread_name_prefix='r2-upload')
+
+        # Native async client, opened lazily on the first async upload
+        self._async_session = aioboto3.Session() if AIOBOTO3_AVAILABLE else None
+        self._async_client = None
+        self._async_client_ctx = None
+        self._async_client_lock = asyncio.Lock()
+        # Event loop the async clients above belong to
+        self._async_loop = None
+        # HTTP/2 client for presigned part uploads, opened lazily and kept alive between files
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+        # Recent file_exists results as (time.monotonic(), exists), most recently used last
+        self._exists_cache: OrderedDict = OrderedDict()
+        self._exists_cache_lock = threading.Lock()
+
+        # Initialize S3 client for R2, reusing a pooled client when one exists
         try:
-            self.s3_client = boto3.client(
-                's3',
-                endpoint_url=endpoint_url,
-                aws_access_key_id=access_key_id,
-                aws_secret_access_key=secret_access_key,
-                region_name='auto'  # R2 uses 'auto' region
+            self.s3_client = self._get_client(
+                endpoint_url, access_key_id, secret_access_key, bucket_name, max_pool_connections
             )
+            # One transfer manager keeps its worker threads alive across uploads
+            self._transfer = create_transfer_manager(self.s3_client, self._transfer_config)
             logger.info(f"R2 uploader initialized for bucket: {bucket_name}")
         except Exception as e:
             logger.error(f"Failed to initialize R2 client: {e}")
             raise
 
+    @staticmethod
+    def _get_client(
+        endpoint_url: str,
+        access_key_id: str,
+        secret_access_key: str,
+        bucket_name: str,
+        max_pool_connections: int
+    ):
+        """
+        Return the shared S3 client for this configuration, creating it on first use.
+
+        boto3 clients are thread-safe, so uploaders with the same credentials
+        share one client and its connection pool.
+        """
+        key = (endpoint_url, access_key_id, secret_access_key, bucket_name, max_pool_connections)
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                client = boto3.session.Session().client(
+                    's3',
+                    endpoint_url=endpoint_url,
+                    aws_access_key_id=access_key_id,
+                    aws_secret_access_key=secret_access_key,
+                    region_name='auto',  # R2 uses 'auto' region
+                    config=_CLIENT_CONFIG.merge(Config(max_pool_connections=max_pool_connections))
+                )
+                _CLIENT_CACHE[key] = client
+            return client
+
     def upload_file(
         self,
         file_path: str,
@@ -100,17 +254,434 @@ class R2Uploader:
                 - url: str (if public_url configured)
                 - error: str (if failed)
         """
-        if not os.path.exists(file_path):
-            logger.error(f"File not found: {file_path}")
+        prepared = self._prepare_upload(file_path, object_name, metadata, content_type)
+        if prepared is None:
+            return {"success": False, "error": "File not found"}
+        return self._put_file(file_path, *prepared)
+
+    async def upload_file_async(
+        self,
+        file_path: str,
+        object_name: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        content_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of upload_file.
+
+        Uses a native aiobotocore client when aioboto3 is installed, otherwise
+        runs the synchronous upload in the uploader's thread pool to avoid blocking.
+        """
+        prepared = self._prepare_upload(file_path, object_name, metadata, content_type)
+        if prepared is None:
             return {"success": False, "error": "File not found"}
+        return await self._put_file_async(file_path, *prepared)
+
+    def _put_file(
+        self,
+        file_path: str,
+        object_name: str,
+        file_size: int,
+        extra_args: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Upload an already prepared file through the shared transfer manager."""
+        try:
+            logger.info("Uploading {} ({:.2f} MB) to R2: {}", file_path, file_size / 1048576, object_name)
+
+            # Upload file
+            self._transfer.upload(
+                file_path,
+                self.bucket_name,
+                object_name,
+                extra_args=extra_args
+            ).result()
+
+            logger.success("Successfully uploaded {} to R2", object_name)
+            return self._upload_result(object_name, file_size)
+
+        except Exception as e:
+            return self._upload_error(e, object_name)
+
+    async def _put_file_async(
+        self,
+        file_path: str,
+        object_name: str,
+        file_size: int,
+        extra_args: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Upload an already prepared file without blocking the event loop.
+
+        Uses the native aiobotocore client when available, otherwise _put_file
+        in the uploader's thread pool.
+        """
+        if not AIOBOTO3_AVAILABLE:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                self._put_file,
+                file_path,
+                object_name,
+                file_size,
+                extra_args
+            )
+
+        try:
+            logger.info("Uploading {} ({:.2f} MB) to R2: {}", file_path, file_size / 1048576, object_name)
+
+            s3 = await self._get_async_client()
+            await s3.upload_file(
+                file_path,
+                self.bucket_name,
+                object_name,
+                ExtraArgs=extra_args,
+                Config=self._async_transfer_config
+            )
+
+            logger.success("Successfully uploaded {} to R2", object_name)
+            return self._upload_result(object_name, file_size)
+
+        except Exception as e:
+            return self._upload_error(e, object_name)
+
+    async def upload_file_multipart_async(
+        self,
+        file_path: str,
+        object_name: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        content_type: Optional[str] = None,
+        part_size: int = MULTIPART_CHUNKSIZE,
+        max_concurrency: int = MAX_CONCURRENCY
+    ) -> Dict[str, Any]:
+        """
+        Upload a large file as a pipelined multipart upload over HTTP/2.
+
+        Parts are streamed to presigned UploadPart URLs in STREAM_BLOCK_SIZE blocks
+        read from a memory-mapped file, so memory use stays at
+        max_concurrency * STREAM_BLOCK_SIZE instead of max_concurrency * part_size.
+        Files up to MULTIPART_THRESHOLD are uploaded with a single request instead.
+
+        Args:
+            file_path: Local file path to upload
+            object_name: S3 object name (defaults to file basename)
+            metadata: Optional metadata to attach to the object
+            content_type: Optional content type (auto-detected if not provided)
+            part_size: Size of each part in bytes (R2 requires at least 5 MB except for the last part)
+            max_concurrency: Number of parts in flight at the same time
+
+        Returns:
+            Same result dict as upload_file
+        """
+        prepared = self._prepare_upload(file_path, object_name, metadata, content_type)
+        if prepared is None:
+            return {"success": False, "error": "File not found"}
+        object_name, file_size, extra_args = prepared
+
+        # Empty files cannot be memory-mapped and small files gain nothing from multipart
+        if file_size <= MULTIPART_THRESHOLD:
+            return await self._put_file_async(file_path, object_name, file_size, extra_args)
+
+        loop = asyncio.get_event_loop()
+        upload_id = None
+        completed = False
+        try:
+            logger.info("Uploading {} ({:.2f} MB) to R2 in parts: {}", file_path, file_size / 1048576, object_name)
+
+            response = await loop.run_in_executor(self._executor, functools.partial(
+                self.s3_client.create_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=object_name,
+                **extra_args
+            ))
+            upload_id = response['UploadId']
+
+            sem = asyncio.Semaphore(max_concurrency)
+            client = await self._get_http_client()
+            with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                tasks = [
+                    asyncio.ensure_future(self._upload_part(
+                        client, sem, mm, object_name, upload_id,
+                        i + 1, start, min(start + part_size, file_size)
+                    ))
+                    for i, start in enumerate(range(0, file_size, part_size))
+                ]
+                try:
+                    parts = await asyncio.gather(*tasks)
+                except BaseException:
+                    # Stop the remaining parts before the mapping is closed
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    raise
+
+            await loop.run_in_executor(self._executor, functools.partial(
+                self.s3_client.complete_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=object_name,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts}
+            ))
+            completed = True
+
+            logger.success("Successfully uploaded {} to R2", object_name)
+            return self._upload_result(object_name, file_size)
+
+        except Exception as e:
+            return self._upload_error(e, object_name)
+
+        finally:
+            if upload_id is not None and not completed:
+                # Drop the already uploaded parts so they are not billed as storage. This also
+                # runs on cancellation or Ctrl-C, so shield the abort from a second cancel.
+                try:
+                    await asyncio.shield(loop.run_in_executor(self._executor, functools.partial(
+                        self.s3_client.abort_multipart_upload,
+                        Bucket=self.bucket_name,
+                        Key=object_name,
+                        UploadId=upload_id
+                    )))
+                except Exception as abort_error:
+                    logger.warning(f"Failed to abort multipart upload {upload_id}: {abort_error!r}")
+
+    async def _upload_part(
+        self,
+        client: httpx.AsyncClient,
+        sem: asyncio.Semaphore,
+        mm: mmap.mmap,
+        object_name: str,
+        upload_id: str,
+        part_number: int,
+        start: int,
+        end: int
+    ) -> Dict[str, Any]:
+        """
+        PUT one part of a multipart upload to its presigned URL and return its ETag entry.
+
+        Connection errors, 429 and 5xx responses are retried up to PART_MAX_ATTEMPTS
+        times with jittered exponential backoff.
+        """
+        url = self.s3_client.generate_presigned_url(
+            'upload_part',
+            Params={
+                'Bucket': self.bucket_name,
+                'Key': object_name,
+                'UploadId': upload_id,
+                'PartNumber': part_number
+            },
+            ExpiresIn=PRESIGNED_URL_EXPIRES
+        )
+
+        async def _body():
+            for offset in range(start, end, STREAM_BLOCK_SIZE):
+                yield mm[offset:min(offset + STREAM_BLOCK_SIZE, end)]
+
+        for attempt in range(1, PART_MAX_ATTEMPTS + 1):
+            try:
+                async with sem:
+                    response = await client.put(
+                        url, content=_body(), headers={'Content-Length': str(end - start)}
+                    )
+                # Throttling and server errors are transient, anything else is final
+                if response.status_code != 429 and response.status_code < 500:
+                    response.raise_for_status()
+                    return {'PartNumber': part_number, 'ETag': response.headers['ETag']}
+                error = f"HTTP {response.status_code}"
+                if attempt == PART_MAX_ATTEMPTS:
+                    response.raise_for_status()
+            except httpx.TransportError as e:
+                error = repr(e)
+                if attempt == PART_MAX_ATTEMPTS:
+                    raise
+
+            delay = PART_RETRY_BACKOFF * 2 ** (attempt - 1) * (0.5 + random.random())
+            logger.warning(
+                f"Part {part_number} of {object_name} failed ({error}), "
+                f"retrying in {delay:.1f}s ({attempt}/{PART_MAX_ATTEMPTS})"
+            )
+            await asyncio.sleep(delay)
+
+    def upload_batch(
+        self,
+        files: List[str],
+        pack_key: str,
+        metadata: Optional[Dict[str, str]] = None,
+        base_dir: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Pack several small files into one tar archive and upload it as a single object.
+
+        Uploading one archive instead of many tiny objects saves a request per file.
+        Members are stored under their path relative to base_dir, so the archive
+        extracts back into the original folder layout.
+
+        Args:
+            files: Local file paths to pack
+            pack_key: S3 object name of the archive
+            metadata: Optional metadata to attach to the archive
+            base_dir: Directory member names are relative to (defaults to the basename only)
+
+        Returns:
+            Same result dict as upload_file, plus:
+                - files: list of packed file paths
+                - missing: list of file paths that no longer existed
+        """
+        packed = []
+        missing = []
+        try:
+            with tempfile.SpooledTemporaryFile(max_size=PACK_SPOOL_SIZE) as buffer:
+                with tarfile.open(mode='w', fileobj=buffer) as tar:
+                    for file_path in files:
+                        if base_dir:
+                            arcname = os.path.relpath(file_path, base_dir)
+                        else:
+                            arcname = os.path.basename(file_path)
+                        try:
+                            tar.add(file_path, arcname=arcname, recursive=False)
+                        except FileNotFoundError:
+                            logger.warning(f"File not found, skipped from pack: {file_path}")
+                            missing.append(file_path)
+                            continue
+                        packed.append(file_path)
+
+                if not packed:
+                    return {"success": False, "error": "File not found", "object_name": pack_key, "missing": missing}
+
+                pack_size = buffer.tell()
+                buffer.seek(0)
+
+                extra_args = {'ContentType': 'application/x-tar'}
+                if metadata:
+                    extra_args['Metadata'] = metadata
+
+                logger.info("Uploading pack of {} files ({:.2f} MB) to R2: {}", len(packed), pack_size / 1048576, pack_key)
+                self._transfer.upload(
+                    buffer,
+                    self.bucket_name,
+                    pack_key,
+                    extra_args=extra_args
+                ).result()
+
+            logger.success("Successfully uploaded {} to R2", pack_key)
+            result = self._upload_result(pack_key, pack_size)
+            result["files"] = packed
+            result["missing"] = missing
+            return result
+
+        except Exception as e:
+            result = self._upload_error(e, pack_key)
+            result["missing"] = missing
+            return result
+
+    async def upload_batch_async(
+        self,
+        files: List[str],
+        pack_key: str,
+        metadata: Optional[Dict[str, str]] = None,
+        base_dir: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async wrapper for upload_batch.
+
+        Runs the synchronous upload in the uploader's thread pool to avoid blocking.
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, self.upload_batch, files, pack_key, metadata, base_dir)
+
+    def _bind_loop(self) -> None:
+        """
+        Forget async clients opened on another event loop.
+
+        aiohttp/httpx sessions only work on the loop that opened them, so an uploader
+        reused across separate asyncio.run() calls reopens its clients on the new loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            if self._async_loop is not None and (self._async_client is not None or self._http_client is not None):
+                logger.debug("Event loop changed, reopening R2 async clients")
+            self._async_loop = loop
+            self._async_client_lock = asyncio.Lock()
+            self._async_client = None
+            self._async_client_ctx = None
+            self._http_client = None
+
+    async def _get_async_client(self):
+        """Open the aiobotocore S3 client once per event loop and reuse it for every async upload."""
+        self._bind_loop()
+        async with self._async_client_lock:
+            if self._async_client is None:
+                self._async_client_ctx = self._async_session.client(
+                    's3',
+                    endpoint_url=self.endpoint_url,
+                    aws_access_key_id=self._access_key_id,
+                    aws_secret_access_key=self._secret_access_key,
+                    region_name='auto',
+                    config=AioConfig(
+                        max_pool_connections=self._max_pool_connections,
+                        **_CLIENT_CONFIG_OPTIONS
+                    )
+                )
+                self._async_client = await self._async_client_ctx.__aenter__()
+            return self._async_client
+
+    async def _get_http_client(self) -> httpx.AsyncClient:
+        """Open the HTTP/2 client for presigned part uploads once per event loop and reuse its connections."""
+        self._bind_loop()
+        async with self._async_client_lock:
+            if self._http_client is None:
+                self._http_client = httpx.AsyncClient(
+                    http2=True,
+                    timeout=httpx.Timeout(
+                        _CLIENT_CONFIG_OPTIONS['connect_timeout'],
+                        read=_CLIENT_CONFIG_OPTIONS['read_timeout']
+                    ),
+                    limits=httpx.Limits(
+                        max_connections=self._max_pool_connections,
+                        max_keepalive_connections=self._max_pool_connections
+                    )
+                )
+            return self._http_client
+
+    def close(self) -> None:
+        """Shut down the upload thread pool, the transfer manager and their worker threads."""
+        self._executor.shutdown(wait=True)
+        self._transfer.shutdown()
+
+    async def aclose(self) -> None:
+        """Close the native async client and the HTTP/2 client if they were opened."""
+        self._bind_loop()
+        async with self._async_client_lock:
+            if self._async_client_ctx is not None:
+                await self._async_client_ctx.__aexit__(None, None, None)
+                self._async_client = None
+                self._async_client_ctx = None
+            if self._http_client is not None:
+                await self._http_client.aclose()
+                self._http_client = None
+
+    def _prepare_upload(
+        self,
+        file_path: str,
+        object_name: Optional[str],
+        metadata: Optional[Dict[str, str]],
+        content_type: Optional[str]
+    ) -> Optional[tuple]:
+        """
+        Resolve object name, file size and ExtraArgs for an upload.
+
+        Returns:
+            (object_name, file_size, extra_args) or None if the file does not exist
+        """
+        # One stat both checks existence and gives the size
+        try:
+            file_size = os.stat(file_path).st_size
+        except FileNotFoundError:
+            logger.error(f"File not found: {file_path}")
+            return None
 
         # Use file basename if object_name not specified
         if object_name is None:
             object_name = os.path.basename(file_path)
 
-        # Get file size
-        file_size = os.path.getsize(file_path)
-
         # Auto-detect content type if not provided
         if content_type is None:
             content_type = self._get_content_type(file_path)
@@ -122,33 +693,29 @@ class R2Uploader:
         if metadata:
             extra_args['Metadata'] = metadata
 
-        try:
-            logger.info(f"Uploading {file_path} ({file_size / 1024 / 1024:.2f} MB) to R2: {object_name}")
+        return object_name, file_size, extra_args
 
-            # Upload file
-            self.s3_client.upload_file(
-                file_path,
-                self.bucket_name,
-                object_name,
-                ExtraArgs=extra_args
-            )
+    def _upload_result(self, object_name: str, file_size: int) -> Dict[str, Any]:
+        """Build the result dict for a successful upload."""
+        self._remember_exists(object_name, True)
 
-            logger.success(f"Successfully uploaded {object_name} to R2")
-
-            result = {
-                "success": True,
-                "object_name": object_name,
-                "size": file_size,
-                "bucket": self.bucket_name
-            }
+        result = {
+            "success": True,
+            "object_name": object_name,
+            "size": file_size,
+            "bucket": self.bucket_name
+        }
 
-            # Add public URL if configured
-            if self.public_url:
-                result["url"] = f"{self.public_url.rstrip('/')}/{object_name}"
+        # Add public URL if configured
+        if self.public_url:
+            result["url"] = f"{self.public_url.rstrip('/')}/{object_name}"
 
-            return result
+        return result
 
-        except ClientError as e:
+    @staticmethod
+    def _upload_error(e: Exception, object_name: str) -> Dict[str, Any]:
+        """Log an upload failure and build the corresponding result dict."""
+        if isinstance(e, ClientError):
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
             error_msg = e.response.get('Error', {}).get('Message', str(e))
             logger.error(f"R2 upload failed: {error_code} - {error_msg}")
@@ -157,35 +724,13 @@ class R2Uploader:
                 "error": f"{error_code}: {error_msg}",
                 "object_name": object_name
             }
-        except Exception as e:
-            logger.error(f"Unexpected error during upload: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "object_name": object_name
-            }
 
-    async def upload_file_async(
-        self,
-        file_path: str,
-        object_name: Optional[str] = None,
-        metadata: Optional[Dict[str, str]] = None,
-        content_type: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """
-        Async wrapper for upload_file.
-
-        Runs the synchronous upload in a thread pool to avoid blocking.
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.upload_file,
-            file_path,
-            object_name,
-            metadata,
-            content_type
-        )
+        logger.error(f"Unexpected error during upload: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "object_name": object_name
+        }
 
     def delete_file(self, object_name: str) -> bool:
         """
@@ -203,60 +748,125 @@ class R2Uploader:
                 Key=object_name
             )
             logger.info(f"Deleted {object_name} from R2")
+            self._remember_exists(object_name, False)
             return True
         except ClientError as e:
             logger.error(f"Failed to delete {object_name}: {e}")
             return False
 
-    def list_files(self, prefix: str = "", max_keys: int = 1000) -> list:
+    def list_files(
+        self,
+        prefix: str = "",
+        max_keys: int = 1000,
+        delimiter: Optional[str] = None
+    ) -> Iterator[str]:
         """
         List files in R2 bucket.
 
+        Pages through list_objects_v2 lazily, so callers that stop iterating
+        early do not fetch the remaining pages.
+
+        Note: this returns a generator, not a list. Wrap it in list() when len()
+        or indexing is needed. A ClientError is logged when it happens during
+        iteration and ends the listing early; it is not raised at call time.
+
         Args:
             prefix: Filter objects by prefix
             max_keys: Maximum number of keys to return
+            delimiter: Only list keys directly below the prefix, up to this
+                delimiter (e.g. '/'); use list_prefixes for the grouped folders
 
-        Returns:
-            List of object keys
+        Yields:
+            Object keys
         """
-        try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix,
-                MaxKeys=max_keys
-            )
+        for page in self._list_pages(prefix, max_keys, delimiter):
+            for obj in page.get('Contents', ()):
+                yield obj['Key']
+
+    def list_prefixes(
+        self,
+        prefix: str = "",
+        delimiter: str = "/",
+        max_keys: int = 1000
+    ) -> Iterator[str]:
+        """
+        List the "folders" (common prefixes) directly below a prefix.
 
-            if 'Contents' in response:
-                return [obj['Key'] for obj in response['Contents']]
-            return []
+        Like list_files, this is a lazy generator.
+
+        Args:
+            prefix: Parent prefix, e.g. 'douyin/'
+            delimiter: Delimiter that separates folder levels
+            max_keys: Maximum number of entries to fetch
+
+        Yields:
+            Common prefixes ending with the delimiter, e.g. 'douyin/anchor/'
+        """
+        for page in self._list_pages(prefix, max_keys, delimiter):
+            for common_prefix in page.get('CommonPrefixes', ()):
+                yield common_prefix['Prefix']
+
+    def _list_pages(self, prefix: str, max_keys: int, delimiter: Optional[str]) -> Iterator[Dict[str, Any]]:
+        """Yield list_objects_v2 response pages, logging a ClientError and stopping on failure."""
+        kwargs = {'Bucket': self.bucket_name, 'Prefix': prefix}
+        if delimiter:
+            kwargs['Delimiter'] = delimiter
+
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            PaginationConfig={'PageSize': min(max_keys, 1000), 'MaxItems': max_keys},
+            **kwargs
+        )
+        try:
+            yield from pages
         except ClientError as e:
             logger.error(f"Failed to list objects: {e}")
-            return []
 
     def file_exists(self, object_name: str) -> bool:
         """
         Check if a file exists in R2 storage.
 
+        Results of recent checks (and of uploads/deletes done through this
+        uploader) are cached for EXISTS_CACHE_TTL seconds, so repeated checks
+        for the same key skip the HEAD request.
+
         Args:
             object_name: S3 object name to check
 
         Returns:
             bool: True if exists, False otherwise
         """
+        with self._exists_cache_lock:
+            cached = self._exists_cache.get(object_name)
+            if cached is not None and time.monotonic() - cached[0] < EXISTS_CACHE_TTL:
+                self._exists_cache.move_to_end(object_name)
+                return cached[1]
+
         try:
             self.s3_client.head_object(
                 Bucket=self.bucket_name,
                 Key=object_name
             )
-            return True
+            exists = True
         except ClientError as e:
-            if e.response['Error']['Code'] == '404':
+            if e.response['Error']['Code'] != '404':
+                logger.error(f"Error checking if {object_name} exists: {e}")
                 return False
-            logger.error(f"Error checking if {object_name} exists: {e}")
-            return False
+            exists = False
 
-    @staticmethod
-    def _get_content_type(file_path: str) -> str:
+        self._remember_exists(object_name, exists)
+        return exists
+
+    def _remember_exists(self, object_name: str, exists: bool) -> None:
+        """Record whether object_name exists in the file_exists cache."""
+        with self._exists_cache_lock:
+            self._exists_cache[object_name] = (time.monotonic(), exists)
+            self._exists_cache.move_to_end(object_name)
+            if len(self._exists_cache) > EXISTS_CACHE_SIZE:
+                self._exists_cache.popitem(last=False)
+
+    @classmethod
+    def _get_content_type(cls, file_path: str) -> str:
         """
         Auto-detect content type based on file extension.
 
@@ -266,30 +876,21 @@ class R2Uploader:
         Returns:
             MIME type string
         """
-        ext = Path(file_path).suffix.lower()
-
-        content_types = {
-            '.mp4': 'video/mp4',
-            '.mkv': 'video/x-matroska',
-            '.flv': 'video/x-flv',
-            '.ts': 'video/mp2t',
-            '.m3u8': 'application/vnd.apple.mpegurl',
-            '.mp3': 'audio/mpeg',
-            '.m4a': 'audio/mp4',
-            '.aac': 'audio/aac',
-            '.txt': 'text/plain',
-            '.json': 'application/json',
-        }
-
-        return content_types.get(ext, 'application/octet-stream')
+        ext = os.path.splitext(file_path)[1].lower()
+        return (
+            cls._CONTENT_TYPES.get(ext)
+            or mimetypes.guess_type(file_path, strict=False)[0]
+            or 'application/octet-stream'
+        )
 
 
-def create_r2_uploader_from_config(config: dict) -> Optional[R2Uploader]:
+def create_r2_uploader_from_config(config: dict, max_pool_connections: Optional[int] = None) -> Optional[R2Uploader]:
     """
     Create R2Uploader instance from configuration dictionary.
 
     Args:
         config: Configuration dict with R2 settings
+        max_pool_connections: Optional HTTP connection pool size override
 
     Returns:
         R2Uploader instance or None if not configured/disabled
@@ -325,7 +926,8 @@ def create_r2_uploader_from_config(config: dict) -> Optional[R2Uploader]:
             secret_access_key=secret_access_key,
             bucket_name=bucket_name,
             endpoint_url=endpoint_url,
-            public_url=public_url
+            public_url=public_url,
+            max_pool_connections=max_pool_connections
         )
         logger.success("R2 uploader configured successfully")
         return uploader
@@ -334,6 +936,21 @@ def create_r2_uploader_from_config(config: dict) -> Optional[R2Uploader]:
         return None
 
 
+def build_object_name(file_path: str) -> str:
+    """
+    Build the R2 object name for a local file, preserving directory structure.
+
+    e.g., downloads/douyin/anchor/video.mp4 -> douyin/anchor/video.mp4
+    """
+    _, sep, relative_path = file_path.partition('downloads')
+    if sep:
+        relative_path = relative_path.lstrip(_PATH_SEPARATORS)
+    else:
+        relative_path = file_path
+
+    return relative_path.translate(_BACKSLASH_TO_SLASH)
+
+
 async def upload_video_to_r2(
     uploader: R2Uploader,
     file_path: str,
@@ -354,29 +971,18 @@ async def upload_video_to_r2(
     Returns:
         Upload result dictionary
     """
-    if not os.path.exists(file_path):
-        logger.error(f"Video file not found: {file_path}")
-        return {"success": False, "error": "File not found"}
-
-    # Construct object name preserving directory structure
-    # e.g., downloads/douyin/anchor/video.mp4 -> douyin/anchor/video.mp4
-    relative_path = file_path
-    if 'downloads' in file_path:
-        parts = file_path.split('downloads')
-        if len(parts) > 1:
-            relative_path = parts[1].lstrip('/\\')
-
-    object_name = relative_path.replace('\\', '/')
+    object_name = build_object_name(file_path)
 
     # Prepare metadata
     metadata = {
         'platform': platform,
         'anchor': anchor_name,
-        'upload_timestamp': str(int(asyncio.get_event_loop().time()))
+        # Wall-clock Unix time in seconds
+        'upload_timestamp': str(time.time_ns() // 1_000_000_000)
     }
 
-    # Upload file
-    result = await uploader.upload_file_async(
+    # Upload file, streaming large recordings part by part to keep memory constant
+    result = await uploader.upload_file_multipart_async(
         file_path=file_path,
         object_name=object_name,
         metadata=metadata